@@ -0,0 +1,717 @@
+"""
+Newsletter System Monitoring Core
+Shared implementation of the API-only monitoring services
+NO DIRECT DATABASE ACCESS - Follows Separation of Concerns
+"""
+
+import os
+import time
+import json
+import socket
+import string
+import logging
+import threading
+import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# orjson is a much faster codec; fall back to the stdlib when it is not installed
+try:
+    import orjson
+    
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+    
+    _json_loads = json.loads
+
+# Environment is read once at startup, so bind the lookup directly
+_ENV = os.environ
+_get = _ENV.get
+
+REQUIRED_EMAIL_VARS = (
+    'MAILGUN_SMTP_USERNAME', 'MAILGUN_SMTP_PASSWORD',
+    'ALERT_EMAIL_FROM', 'ALERT_EMAIL_TO'
+)
+
+# Service health statuses that trigger an alert
+ALERT_STATUSES = ('degraded', 'error', 'inactive')
+
+
+# Small JSON requests go out immediately (no Nagle delay) and the idle
+# connection between cycles is kept alive through middleboxes
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, 'TCP_KEEPIDLE'):
+    _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+if hasattr(socket, 'TCP_KEEPINTVL'):
+    _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 30))
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that applies the TCP socket options above"""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = _SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+@dataclass(slots=True)
+class HealthStatus:
+    """Health of one monitored service for a single cycle"""
+    service: str
+    status: str
+    issues: list = field(default_factory=list)
+    api_accessible: bool = True
+    success_rate: float = 0.0
+    recent_runs: int = 0
+    recent_newsletters: int = 0
+    last_run: str | None = None
+    last_generation: str | None = None
+    error: str | None = None
+
+
+@lru_cache(maxsize=48)
+def _first_slot_from_hour(slots, hour):
+    """Index of the first (hour, minute) slot at or after the given hour"""
+    for index, (slot_hour, _) in enumerate(slots):
+        if slot_hour >= hour:
+            return index
+    return len(slots)
+
+
+class MonitoringCore:
+    """
+    Shared monitoring logic for the API-only service variants
+    FOLLOWS SEPARATION OF CONCERNS - API ACCESS ONLY
+    """
+    
+    # Variant labels used in logs, alert footers and heartbeats
+    SERVICE_LABEL = 'API Only'
+    HEARTBEAT_VERSION = '2.0.0-api-only'
+    
+    def __init__(self):
+        """Initialize monitoring service"""
+        logger.info(f"🚀 Newsletter Monitoring Service Starting ({self.SERVICE_LABEL})")
+        self.load_config()
+        self.setup_http_session()
+        self._bundle_supported = True
+        
+        # Circuit breaker state for the Flask API
+        self._api_failures = 0
+        self._circuit_open_until = 0.0
+        self._circuit_lock = threading.Lock()
+        
+        self._pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='monitoring-io')
+        # alert key -> time.monotonic() of last send, least recently sent first
+        self.last_alert_times = OrderedDict()
+        self._ts_cache = {}
+        self._last_heartbeat = float('-inf')
+        self.validate_configuration()
+        
+        # Built on the first alert, see send_alert
+        self._smtp_pool = None
+        
+        # Alert headers and body only vary by subject, date, time and message
+        self._body_tpl = string.Template(f"""
+Newsletter System Alert
+
+Service: $service
+Time: $time UTC
+Issue: $subject
+
+Details:
+$message
+
+---
+Newsletter System Monitoring Service ({self.SERVICE_LABEL})
+Architecture: Separation of Concerns Compliant
+""")
+        self._alert_headers = (
+            f"From: {self.alert_email_from}\r\n"
+            f"To: {self.alert_email_to}\r\n"
+            "MIME-Version: 1.0\r\n"
+            "Content-Type: text/plain; charset=us-ascii\r\n"
+        )
+        
+    def load_config(self):
+        """Load configuration from environment variables"""
+        logger.info("⚙️ Loading configuration...")
+        
+        # API Access (REQUIRED)
+        self.flask_api_url = _get('FLASK_API_URL', 'https://api.contentonrails.com')
+        self.flask_api_key = _get('FLASK_API_KEY')
+        
+        # Endpoint URLs and request headers never change, so build them once
+        base_url = self.flask_api_url.rstrip('/')
+        self._url_bundle = f"{base_url}/api/v1/monitoring/bundle"
+        self._url_system = f"{base_url}/api/v1/monitoring/status"
+        self._url_worker = f"{base_url}/api/v1/monitoring/worker/status"
+        self._url_publisher = f"{base_url}/api/v1/monitoring/publisher/status"
+        self._url_heartbeat = f"{base_url}/api/v1/monitoring/heartbeat"
+        
+        self._auth_headers = {'Content-Type': 'application/json'}
+        if self.flask_api_key:
+            self._auth_headers['Authorization'] = f"Bearer {self.flask_api_key}"
+        
+        # Ensure no database access (COMPLIANCE CHECK)
+        supabase_url = _get('SUPABASE_URL')
+        supabase_key = _get('SUPABASE_SERVICE_ROLE_KEY')
+        qdrant_url = _get('QDRANT_URL')
+        
+        if supabase_url or supabase_key or qdrant_url:
+            logger.warning("⚠️ ARCHITECTURE VIOLATION: Database credentials detected!")
+            logger.warning("⚠️ Monitoring Service should use API endpoints ONLY")
+            logger.warning("⚠️ Remove SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY, QDRANT_URL")
+        
+        # Monitoring settings
+        self.monitoring_enabled = _get('MONITORING_ENABLED', 'true').lower() == 'true'
+        self.health_check_interval = int(_get('HEALTH_CHECK_INTERVAL', 300))  # 5 minutes
+        self.schedule_check_interval = int(_get('SCHEDULE_CHECK_INTERVAL', 600))  # 10 minutes
+        self.alert_cooldown_minutes = int(_get('ALERT_COOLDOWN_MINUTES', 30))
+        self.max_consecutive_failures = int(_get('MAX_CONSECUTIVE_FAILURES', 3))
+        self.heartbeat_min_interval = int(_get('HEARTBEAT_MIN_INTERVAL', self.health_check_interval))
+        
+        # Email alerts
+        self.email_alerts_enabled = _get('EMAIL_ALERTS_ENABLED', 'true').lower() == 'true'
+        self.smtp_server = _get('SMTP_SERVER', 'smtp.mailgun.org')
+        self.smtp_port = int(_get('SMTP_PORT', 587))
+        self.smtp_use_tls = _get('SMTP_USE_TLS', 'true').lower() == 'true'
+        self.smtp_username = _get('MAILGUN_SMTP_USERNAME')
+        self.smtp_password = _get('MAILGUN_SMTP_PASSWORD')
+        self.alert_email_from = _get('ALERT_EMAIL_FROM')
+        self.alert_email_to = _get('ALERT_EMAIL_TO')
+        self.alert_subject_prefix = _get('ALERT_EMAIL_SUBJECT_PREFIX', '[Newsletter System Alert]')
+        # Just over one cycle so the connection survives until the next cycle's alerts
+        self.smtp_max_idle_seconds = int(_get('SMTP_MAX_IDLE_SECONDS', self.health_check_interval + 60))
+        
+        # Service schedules
+        self.worker_schedule = {
+            'frequency': '4x_daily',
+            'times': ['06:00', '12:00', '18:00', '00:00'],  # UTC
+            'max_delay_minutes': 30
+        }
+        
+        self.publisher_schedule = {
+            'frequency': '1x_daily', 
+            'times': ['08:00'],  # UTC
+            'max_delay_minutes': 60
+        }
+        
+        # Alert subjects and message intros only depend on service and status
+        self._alert_subjects = {
+            (service, status): f"{service.title()} Service {status.title()}"
+            for service in ('worker', 'publisher') for status in ALERT_STATUSES
+        }
+        self._alert_intros = {
+            service: f"{service.title()} service issues detected:\n\n"
+            for service in ('worker', 'publisher')
+        }
+        self._api_unreachable_message = f"Cannot connect to Flask API at {self.flask_api_url}"
+        
+        # Sorted (hour, minute) slots, parsed once instead of every cycle
+        self._worker_slots = tuple(sorted(
+            tuple(map(int, t.split(':'))) for t in self.worker_schedule['times']
+        ))
+        self._publisher_slots = tuple(sorted(
+            tuple(map(int, t.split(':'))) for t in self.publisher_schedule['times']
+        ))
+        
+        logger.info("✅ Configuration loaded")
+    
+    def validate_configuration(self):
+        """Validate configuration follows architectural guidelines"""
+        logger.info("🔍 Validating architectural compliance...")
+        
+        # Check API access
+        if not self.flask_api_url:
+            raise ValueError("FLASK_API_URL is required for monitoring service")
+        
+        # Check email configuration
+        if self.email_alerts_enabled:
+            missing_vars = [var for var in REQUIRED_EMAIL_VARS if not _get(var)]
+            if missing_vars:
+                logger.warning(f"⚠️ Missing email configuration: {missing_vars}")
+                logger.warning("⚠️ Disabling email alerts")
+                self.email_alerts_enabled = False
+        
+        logger.info("✅ Configuration validation complete")
+    
+    def setup_http_session(self):
+        """Setup pooled HTTP session for Flask API requests"""
+        # One keep-alive session per service so each cycle reuses the
+        # TCP+TLS connection instead of handshaking on every request
+        self.http = requests.Session()
+        
+        adapter = _KeepAliveAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        
+        self.http.headers.update(self._auth_headers)
+    
+    def _circuit_open(self):
+        """Whether API requests are currently being short-circuited"""
+        return time.monotonic() < self._circuit_open_until
+    
+    def _record_api_success(self):
+        """Close the circuit after a successful API request"""
+        if not self._api_failures:
+            return
+        
+        with self._circuit_lock:
+            if self._api_failures >= self.max_consecutive_failures:
+                logger.info("🔌 Flask API reachable again, resuming requests")
+            self._api_failures = 0
+            self._circuit_open_until = 0.0
+    
+    def _record_api_failure(self):
+        """Open the circuit, with growing backoff, after repeated API failures"""
+        with self._circuit_lock:
+            self._api_failures += 1
+            excess = self._api_failures - self.max_consecutive_failures
+            if excess < 0:
+                return
+            
+            backoff = min(self.health_check_interval, 30 * 2 ** excess)
+            self._circuit_open_until = time.monotonic() + backoff
+            logger.warning(f"🔌 Flask API failed {self._api_failures} times in a row, pausing requests for {backoff}s")
+    
+    def make_api_request(self, url, method='GET', data=None):
+        """Make API request to a prebuilt Flask API URL"""
+        # Don't pay the full timeout on every call while the API is known to be down
+        if self._circuit_open():
+            return None
+        
+        try:
+            if method == 'GET':
+                response = self.http.get(url, timeout=30)
+            elif method == 'POST':
+                response = self.http.post(url, data=_json_dumps(data), timeout=30)
+            else:
+                raise ValueError(f"Unsupported method: {method}")
+            
+            response.raise_for_status()
+            result = _json_loads(response.content)
+            self._record_api_success()
+            return result
+            
+        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+            logger.error(f"❌ API request failed: {url} - {e}")
+            self._record_api_failure()
+            return None
+    
+    def fetch_all_status(self):
+        """Fetch system, worker and publisher status in one API round-trip"""
+        if self._circuit_open():
+            return {'system': None, 'worker': None, 'publisher': None}
+        
+        if self._bundle_supported:
+            url = self._url_bundle
+            
+            try:
+                response = self.http.get(url, timeout=30)
+                
+                if response.status_code == 404:
+                    # Older API deployments have no bundle endpoint
+                    logger.info("ℹ️ Bundle endpoint not available, using per-endpoint status requests")
+                    self._bundle_supported = False
+                else:
+                    response.raise_for_status()
+                    bundle = _json_loads(response.content)
+                    self._record_api_success()
+                    return {
+                        'system': bundle.get('system'),
+                        'worker': bundle.get('worker'),
+                        'publisher': bundle.get('publisher')
+                    }
+                    
+            except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+                logger.error(f"❌ API request failed: {url} - {e}")
+                self._record_api_failure()
+                return {'system': None, 'worker': None, 'publisher': None}
+        
+        # Independent requests, so fan them out instead of paying each RTT in turn;
+        # the calling thread makes one of them itself rather than idling on a future
+        worker = self._pool.submit(self.make_api_request, self._url_worker)
+        publisher = self._pool.submit(self.make_api_request, self._url_publisher)
+        system = self.make_api_request(self._url_system)
+        
+        return {
+            'system': system,
+            'worker': worker.result(),
+            'publisher': publisher.result()
+        }
+    
+    def check_worker_health(self, worker_status):
+        """Analyze worker service status returned by the API"""
+        logger.info("🤖 Checking Worker Service health...")
+        
+        try:
+            if not worker_status:
+                return HealthStatus(
+                    service='worker',
+                    status='error',
+                    issues=['Failed to get worker status from API'],
+                    api_accessible=False
+                )
+            
+            # Analyze health based on API response
+            health_status = HealthStatus(
+                service='worker',
+                status=worker_status.get('status', 'unknown'),
+                recent_runs=worker_status.get('recent_runs', 0),
+                success_rate=worker_status.get('success_rate', 0),
+                last_run=worker_status.get('last_run'),
+                issues=worker_status.get('issues', [])
+            )
+            
+            # Additional health checks
+            if health_status.success_rate < 80:
+                health_status.status = 'degraded'
+                health_status.issues.append(f"Low success rate: {health_status.success_rate:.1f}%")
+            
+            if health_status.recent_runs == 0:
+                health_status.status = 'inactive'
+                health_status.issues.append("No recent worker runs")
+            
+            logger.info(f"🤖 Worker health: {health_status.status} ({health_status.success_rate:.1f}% success)")
+            return health_status
+            
+        except Exception as e:
+            logger.error(f"❌ Worker health check failed: {e}")
+            return HealthStatus(
+                service='worker',
+                status='error',
+                error=str(e),
+                issues=[f"Health check failed: {e}"],
+                api_accessible=False
+            )
+    
+    def _parse_iso(self, timestamp):
+        """Parse an API ISO timestamp, caching results across cycles"""
+        parsed = self._ts_cache.get(timestamp)
+        if parsed is not None:
+            return parsed
+        
+        if timestamp.endswith('Z'):
+            parsed = datetime.fromisoformat(timestamp[:-1] + '+00:00')
+        else:
+            parsed = datetime.fromisoformat(timestamp)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        
+        # The publisher reports the same timestamp for a whole day, so a
+        # handful of entries is plenty; evict oldest first
+        if len(self._ts_cache) >= 32:
+            del self._ts_cache[next(iter(self._ts_cache))]
+        self._ts_cache[timestamp] = parsed
+        return parsed
+    
+    def check_publisher_health(self, publisher_status, now=None):
+        """Analyze publisher service status returned by the API"""
+        logger.info("📰 Checking Publisher Service health...")
+        now = now or datetime.now(timezone.utc)
+        
+        try:
+            if not publisher_status:
+                return HealthStatus(
+                    service='publisher',
+                    status='error',
+                    issues=['Failed to get publisher status from API'],
+                    api_accessible=False
+                )
+            
+            # Analyze health based on API response
+            health_status = HealthStatus(
+                service='publisher',
+                status=publisher_status.get('status', 'unknown'),
+                recent_newsletters=publisher_status.get('recent_newsletters', 0),
+                last_generation=publisher_status.get('last_generation'),
+                issues=publisher_status.get('issues', [])
+            )
+            
+            # Additional health checks
+            if health_status.last_generation:
+                try:
+                    last_gen_time = self._parse_iso(health_status.last_generation)
+                    hours_since_last = (now - last_gen_time).total_seconds() / 3600
+                    
+                    if hours_since_last > 25:  # Should generate daily
+                        health_status.status = 'degraded'
+                        health_status.issues.append(f"No generation in {hours_since_last:.1f} hours")
+                except Exception as e:
+                    health_status.issues.append(f"Invalid generation timestamp: {e}")
+            
+            if health_status.recent_newsletters == 0:
+                health_status.status = 'inactive'
+                health_status.issues.append("No recent newsletter generation")
+            
+            logger.info(f"📰 Publisher health: {health_status.status} ({health_status.recent_newsletters} recent)")
+            return health_status
+            
+        except Exception as e:
+            logger.error(f"❌ Publisher health check failed: {e}")
+            return HealthStatus(
+                service='publisher',
+                status='error',
+                error=str(e),
+                issues=[f"Health check failed: {e}"],
+                api_accessible=False
+            )
+    
+    def check_overall_system_health(self, system_status):
+        """Analyze overall system status returned by the API"""
+        logger.info("🔍 Checking Overall System health...")
+        
+        try:
+            if not system_status:
+                return {
+                    'status': 'error',
+                    'issues': ['Failed to get system status from API'],
+                    'api_accessible': False
+                }
+            
+            return {
+                'status': system_status.get('status', 'unknown'),
+                'components': system_status.get('components', {}),
+                'api_accessible': True,
+                'timestamp': system_status.get('timestamp')
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ System health check failed: {e}")
+            return {
+                'status': 'error',
+                'error': str(e),
+                'issues': [f"System health check failed: {e}"],
+                'api_accessible': False
+            }
+    
+    def get_next_scheduled_time(self, slots, now):
+        """Get the first scheduled time after now from sorted (hour, minute) slots"""
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        for hour, minute in slots[_first_slot_from_hour(slots, now.hour):]:
+            scheduled_datetime = today_start.replace(hour=hour, minute=minute)
+            if scheduled_datetime > now:
+                return scheduled_datetime
+        
+        # All of today's times have passed, so the next one is tomorrow's first
+        hour, minute = slots[0]
+        return today_start.replace(hour=hour, minute=minute) + timedelta(days=1)
+    
+    def next_cycle_deadline(self, next_cycle):
+        """Pull the next cycle forward to the closest schedule deadline"""
+        now = datetime.now(timezone.utc)
+        
+        for slots, schedule in ((self._worker_slots, self.worker_schedule),
+                                (self._publisher_slots, self.publisher_schedule)):
+            # A run becomes overdue once its tolerance window closes
+            max_delay = timedelta(minutes=schedule['max_delay_minutes'])
+            deadline = self.get_next_scheduled_time(slots, now - max_delay) + max_delay
+            next_cycle = min(next_cycle, time.monotonic() + (deadline - now).total_seconds())
+        
+        return next_cycle
+    
+    def heartbeat_timestamp(self, now):
+        """Format the heartbeat timestamp sent to the API"""
+        return now.isoformat()
+    
+    def record_monitoring_heartbeat(self, now=None):
+        """Record monitoring service heartbeat via API"""
+        # Cycles pulled forward to a schedule deadline don't need a heartbeat of their own
+        if time.monotonic() - self._last_heartbeat < self.heartbeat_min_interval * 0.9:
+            logger.info("💓 Heartbeat recorded recently, skipping")
+            return
+        
+        now = now or datetime.now(timezone.utc)
+        
+        try:
+            heartbeat_data = {
+                'service': 'monitoring',
+                'status': 'active',
+                'timestamp': self.heartbeat_timestamp(now),
+                'version': self.HEARTBEAT_VERSION
+            }
+            
+            result = self.make_api_request(self._url_heartbeat, 'POST', heartbeat_data)
+            
+            if result:
+                self._last_heartbeat = time.monotonic()
+                logger.info("💓 Monitoring heartbeat recorded")
+            else:
+                logger.warning("⚠️ Failed to record monitoring heartbeat")
+                
+        except Exception as e:
+            logger.error(f"❌ Failed to record heartbeat: {e}")
+    
+    def send_alert(self, subject, message, service_name, now=None):
+        """Send email alert"""
+        if not self.email_alerts_enabled:
+            logger.info("📧 Email alerts disabled, skipping alert")
+            return
+        
+        # Check cooldown
+        alert_key = f"{service_name}_{subject}"
+        now = now or datetime.now(timezone.utc)
+        
+        last_sent = self.last_alert_times.get(alert_key)
+        if last_sent is not None and time.monotonic() - last_sent < self.alert_cooldown_minutes * 60:
+            logger.info(f"📧 Alert cooldown active for {alert_key}, skipping")
+            return
+        
+        # smtplib and the email package pull in ssl, socket and most of email.*;
+        # import them on the first alert so services that never alert skip the cost
+        from email.utils import format_datetime, getaddresses
+        from smtp_pool import SMTPConnectionPool
+        
+        try:
+            # Parse the header properly; display names may themselves contain commas
+            recipients = [addr for _, addr in getaddresses([self.alert_email_to])]
+            body = self._body_tpl.substitute(
+                service=service_name, time=now.isoformat(), subject=subject, message=message
+            )
+            
+            try:
+                # Plain-text ASCII alerts need no MIME object tree; render the RFC 5322 bytes directly
+                raw = (
+                    self._alert_headers
+                    + f"Subject: {self.alert_subject_prefix} {subject}\r\n"
+                    + f"Date: {format_datetime(now)}\r\n\r\n"
+                    + body.replace('\n', '\r\n')
+                ).encode('ascii')
+                
+                def deliver(server):
+                    server.sendmail(self.alert_email_from, recipients, raw)
+            except UnicodeEncodeError:
+                # Non-ASCII text (API issue strings, exception messages, display names)
+                # needs real header and body encoding, so let the email package do it
+                from email.message import EmailMessage
+                
+                msg = EmailMessage()
+                msg['From'] = self.alert_email_from
+                msg['To'] = self.alert_email_to
+                msg['Subject'] = f"{self.alert_subject_prefix} {subject}"
+                msg['Date'] = format_datetime(now)
+                msg.set_content(body)
+                
+                def deliver(server):
+                    server.send_message(msg, to_addrs=recipients)
+            
+            if self._smtp_pool is None:
+                self._smtp_pool = SMTPConnectionPool(
+                    self.smtp_server, self.smtp_port, self.smtp_username, self.smtp_password,
+                    use_tls=self.smtp_use_tls, max_idle=self.smtp_max_idle_seconds
+                )
+            self._smtp_pool.send(deliver)
+            
+            # Bounded so new subject variants can't grow the table forever
+            self.last_alert_times[alert_key] = time.monotonic()
+            self.last_alert_times.move_to_end(alert_key)
+            while len(self.last_alert_times) > 128:
+                self.last_alert_times.popitem(last=False)
+            logger.info(f"📧 Alert sent: {subject}")
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to send alert: {e}")
+    
+    def alert_on_health(self, health_status, now):
+        """Send an alert when a service's health needs attention"""
+        if health_status.status not in ALERT_STATUSES:
+            return
+        
+        self.send_alert(
+            self._alert_subjects[(health_status.service, health_status.status)],
+            self._alert_intros[health_status.service] + '\n'.join(health_status.issues),
+            health_status.service,
+            now=now
+        )
+    
+    def handle_api_unreachable(self, now):
+        """React to the Flask API being unreachable during a cycle"""
+        logger.warning("⚠️ Flask API not accessible - monitoring endpoints may not be deployed")
+    
+    def run_monitoring_cycle(self):
+        """Run one complete monitoring cycle"""
+        logger.info("🔄 Starting monitoring cycle...")
+        
+        # One timestamp for the whole cycle keeps cooldowns and ages consistent
+        now = datetime.now(timezone.utc)
+        
+        try:
+            # Record heartbeat while the status requests are in flight
+            heartbeat = self._pool.submit(self.record_monitoring_heartbeat, now)
+            
+            # Fetch system, worker and publisher status together
+            bundle = self.fetch_all_status()
+            heartbeat.result()
+            
+            # Check overall system health
+            system_health = self.check_overall_system_health(bundle['system'])
+            
+            if not system_health.get('api_accessible', False):
+                self.handle_api_unreachable(now)
+                return
+            
+            # Check worker health
+            worker_health = self.check_worker_health(bundle['worker'])
+            self.alert_on_health(worker_health, now)
+            
+            # Check publisher health
+            publisher_health = self.check_publisher_health(bundle['publisher'], now=now)
+            self.alert_on_health(publisher_health, now)
+            
+            # Log summary
+            logger.info(f"📊 Monitoring cycle complete - Worker: {worker_health.status}, Publisher: {publisher_health.status}")
+            
+        except Exception as e:
+            logger.error(f"❌ Monitoring cycle failed: {e}")
+            self.send_alert("Monitoring System Error", f"Monitoring cycle failed: {e}", "monitoring", now=now)
+    
+    def run(self):
+        """Main monitoring loop"""
+        logger.info(f"🚀 Newsletter Monitoring Service started ({self.SERVICE_LABEL})")
+        logger.info(f"🔗 Flask API URL: {self.flask_api_url}")
+        logger.info(f"⚙️ Health check interval: {self.health_check_interval}s")
+        logger.info(f"📧 Email alerts: {'enabled' if self.email_alerts_enabled else 'disabled'}")
+        logger.info("🏗️ Architecture: Separation of Concerns Compliant")
+        
+        if not self.monitoring_enabled:
+            logger.warning("⚠️ Monitoring is disabled")
+            return
+        
+        try:
+            # Monotonic deadlines keep the cadence from drifting by each cycle's duration
+            next_cycle = time.monotonic()
+            
+            while True:
+                self.run_monitoring_cycle()
+                
+                next_cycle = max(next_cycle + self.health_check_interval, time.monotonic())
+                next_cycle = self.next_cycle_deadline(next_cycle)
+                
+                sleep_for = max(0, next_cycle - time.monotonic())
+                logger.info(f"😴 Sleeping for {sleep_for:.0f} seconds...")
+                time.sleep(sleep_for)
+                
+        except KeyboardInterrupt:
+            logger.info("🛑 Monitoring service stopped by user")
+        except Exception as e:
+            logger.error(f"💥 Monitoring service crashed: {e}")
+            raise
+
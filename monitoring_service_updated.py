@@ -6,14 +6,19 @@ Monitors Worker and Publisher services, sends alerts, tracks health
 
 import os
 import time
-import json
+import asyncio
+import bisect
 import logging
-import smtplib
-import requests
-from datetime import datetime, timedelta
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import re
+import string
+import threading
+import httpx
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from email.message import EmailMessage
+from email.utils import getaddresses
 from supabase import create_client, Client
+from smtp_pool import SMTPConnectionPool
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +27,113 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# orjson encodes request bodies much faster than the stdlib json httpx uses by default
+try:
+    import orjson
+    
+    class _JsonClient(httpx.Client):
+        """httpx client that encodes json= request bodies with orjson"""
+        
+        def build_request(self, method, url, *, json=None, headers=None, **kwargs):
+            if json is not None:
+                kwargs['content'] = orjson.dumps(json, option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC)
+                headers = httpx.Headers(headers)
+                headers['Content-Type'] = 'application/json'
+            return super().build_request(method, url, headers=headers, **kwargs)
+except ImportError:
+    _JsonClient = httpx.Client
+
+# Numbers in alert text (rates, hours, times) vary between cycles without changing the alert
+_NUMBER_RE = re.compile(r'\d+(\.\d+)?')
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a backend whose circuit is open"""
+
+
+class CircuitBreaker:
+    """Fail fast once a backend keeps failing, probing it again after a cool-off"""
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+    
+    def __init__(self, name, fail_threshold=5, reset_timeout=30, half_open_max=1):
+        self.name = name
+        self.fail_threshold = fail_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max = half_open_max
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.last_failure_ts = 0
+        self._half_open_calls = 0
+        self._lock = threading.Lock()
+        self._settled = threading.Condition(self._lock)
+    
+    def _transition(self, state):
+        """Change state, logging only on an actual transition"""
+        if state == self.state:
+            return
+        
+        if state == self.OPEN:
+            logger.warning(f"🔌 {self.name} circuit opened after {self.consecutive_failures} failures, failing fast for {self.reset_timeout}s")
+        else:
+            logger.info(f"🔌 {self.name} circuit {state}")
+        self.state = state
+    
+    def _acquire(self):
+        """Admit a call or raise CircuitOpenError"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.last_failure_ts < self.reset_timeout:
+                    raise CircuitOpenError(f"{self.name} circuit open")
+                self._transition(self.HALF_OPEN)
+                self._half_open_calls = 0
+            
+            if self.state == self.HALF_OPEN:
+                if self._half_open_calls < self.half_open_max:
+                    self._half_open_calls += 1
+                    return
+                
+                # Concurrent callers wait on the probe rather than failing against a healthy backend
+                self._settled.wait_for(lambda: self.state != self.HALF_OPEN)
+                if self.state == self.OPEN:
+                    raise CircuitOpenError(f"{self.name} circuit open")
+    
+    def call(self, fn, *args, **kwargs):
+        """Run fn through the breaker"""
+        self._acquire()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            with self._lock:
+                self.consecutive_failures += 1
+                self.last_failure_ts = time.monotonic()
+                if self.state == self.HALF_OPEN or self.consecutive_failures >= self.fail_threshold:
+                    self._transition(self.OPEN)
+                self._settled.notify_all()
+            raise
+        
+        with self._lock:
+            self.consecutive_failures = 0
+            self._transition(self.CLOSED)
+            self._settled.notify_all()
+        return result
+
+
+def _iso_z(moment):
+    """Format an aware UTC datetime the way Supabase expects, with a Z suffix"""
+    return moment.isoformat().replace('+00:00', 'Z')
+
+
+@lru_cache(maxsize=8)
+def _window_bounds(day, slot, lead_minutes, max_delay_minutes):
+    """Return (start, end, start_iso, end_iso) of a schedule slot's window on a given day"""
+    scheduled_datetime = datetime(day.year, day.month, day.day, tzinfo=timezone.utc) + timedelta(minutes=slot)
+    window_start = scheduled_datetime - timedelta(minutes=lead_minutes)
+    window_end = scheduled_datetime + timedelta(minutes=max_delay_minutes)
+    return window_start, window_end, _iso_z(window_start), _iso_z(window_end)
+
 
 class NewsletterMonitoringService:
     """Monitoring service for Newsletter System"""
@@ -31,7 +143,17 @@ class NewsletterMonitoringService:
         logger.info("🚀 Newsletter Monitoring Service Starting")
         self.load_config()
         self.setup_database()
-        self.last_alert_times = {}
+        self.last_alert_times = {}  # fingerprint -> [last_sent, suppressed since last_sent]
+        self._pending_events = []  # process_monitoring rows awaiting the next flush
+        self._confirmed_worker_slots = (None, set())  # (day, slots seen running that day)
+        self._supabase_breaker = CircuitBreaker('Supabase', fail_threshold=5, reset_timeout=30, half_open_max=1)
+        self._smtp_breaker = CircuitBreaker('SMTP', fail_threshold=5, reset_timeout=30, half_open_max=1)
+        self._begin_cycle()
+        
+        self._smtp_pool = SMTPConnectionPool(
+            self.smtp_server, self.smtp_port, self.smtp_username, self.smtp_password,
+            use_tls=self.smtp_use_tls, max_idle=self.smtp_max_idle_seconds
+        )
         
     def load_config(self):
         """Load configuration from environment variables"""
@@ -50,6 +172,7 @@ class NewsletterMonitoringService:
         self.schedule_check_interval = int(os.getenv('SCHEDULE_CHECK_INTERVAL', 600))  # 10 minutes
         self.alert_cooldown_minutes = int(os.getenv('ALERT_COOLDOWN_MINUTES', 30))
         self.max_consecutive_failures = int(os.getenv('MAX_CONSECUTIVE_FAILURES', 3))
+        self.supabase_max_rows = int(os.getenv('SUPABASE_MAX_ROWS', 1000))  # PostgREST db-max-rows
         
         # Email alerts
         self.email_alerts_enabled = os.getenv('EMAIL_ALERTS_ENABLED', 'true').lower() == 'true'
@@ -61,6 +184,28 @@ class NewsletterMonitoringService:
         self.alert_email_from = os.getenv('ALERT_EMAIL_FROM')
         self.alert_email_to = os.getenv('ALERT_EMAIL_TO')
         self.alert_subject_prefix = os.getenv('ALERT_EMAIL_SUBJECT_PREFIX', '[Newsletter System Alert]')
+        # Just over one cycle so the connection survives until the next cycle's alerts
+        self.smtp_max_idle_seconds = int(os.getenv('SMTP_MAX_IDLE_SECONDS', self.health_check_interval + 60))
+        
+        # Alert emails only vary in subject and body, so build the constant parts once
+        self.alert_recipients = [addr for _, addr in getaddresses([self.alert_email_to or ''])]
+        self._alert_headers = {
+            'From': self.alert_email_from,
+            'To': self.alert_email_to
+        }
+        self._body_template = string.Template("""
+Newsletter System Alert
+
+Service: $service
+Time: $time
+Issue: $subject
+
+Details:
+$message
+
+---
+Newsletter System Monitoring Service
+""")
         
         # Service schedules
         self.worker_schedule = {
@@ -75,6 +220,16 @@ class NewsletterMonitoringService:
             'max_delay_minutes': 60
         }
         
+        # Scheduled times as sorted minutes past midnight, for bisecting
+        self._worker_slot_minutes = self._slot_minutes(self.worker_schedule['times'])
+        self._publisher_slot_minutes = self._slot_minutes(self.publisher_schedule['times'])
+        self._worker_max_delay = self.worker_schedule['max_delay_minutes']
+        self._publisher_max_delay = self.publisher_schedule['max_delay_minutes']
+        
+        # Fixed lookbacks, built once rather than every cycle
+        self._worker_lookback = timedelta(hours=2)
+        self._publisher_lookback = timedelta(hours=24)
+        
         logger.info("✅ Configuration loaded")
     
     def setup_database(self):
@@ -82,48 +237,101 @@ class NewsletterMonitoringService:
         try:
             self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
             logger.info("✅ Supabase client initialized")
+            self.setup_http_session()
             
-            # Test connection
-            test_result = self.supabase.table('newsletters').select('uuid').limit(1).execute()
-            logger.info("✅ Database connection verified")
+            # The connection is verified by the first query of the first cycle rather
+            # than a startup round-trip, so a Supabase blip can't hold up a restart
+            self._db_validated = False
             
         except Exception as e:
             logger.error(f"❌ Failed to setup database: {e}")
             raise
     
-    def check_worker_health(self):
+    def _begin_cycle(self):
+        """Snapshot the current time once for every check in a cycle"""
+        self._cycle_now = datetime.now(timezone.utc)
+        self._cycle_now_iso = _iso_z(self._cycle_now)
+    
+    def setup_http_session(self):
+        """Swap the PostgREST session for a pooled keep-alive httpx client"""
+        # The SDK default pays a fresh TCP+TLS handshake far more often than needed;
+        # keep connections warm and let HTTP/2 multiplex the concurrent cycle queries
+        postgrest = self.supabase.postgrest
+        old_session = postgrest.session
+        limits = httpx.Limits(max_keepalive_connections=10, max_connections=20, keepalive_expiry=60.0)
+        
+        try:
+            transport = httpx.HTTPTransport(retries=2, http2=True, limits=limits)
+        except ImportError:
+            # HTTP/2 needs the optional h2 package; keep-alive alone still helps
+            logger.warning("⚠️ h2 not installed, using HTTP/1.1 for Supabase")
+            transport = httpx.HTTPTransport(retries=2, limits=limits)
+        
+        postgrest.session = _JsonClient(
+            base_url=old_session.base_url,
+            headers=old_session.headers,
+            timeout=old_session.timeout,
+            follow_redirects=True,
+            transport=transport
+        )
+        old_session.close()
+    
+    async def _execute(self, query):
+        """Run a blocking Supabase query off the event loop"""
+        result = await asyncio.to_thread(self._supabase_breaker.call, query.execute)
+        if not self._db_validated:
+            self._db_validated = True
+            logger.info("✅ Database connection verified")
+        return result
+    
+    async def check_worker_health(self):
         """Check worker service health"""
         logger.info("🤖 Checking Worker Service health...")
         
         try:
             # Get recent worker runs (last 2 hours)
-            cutoff_time = datetime.utcnow() - timedelta(hours=2)
-            cutoff_str = cutoff_time.isoformat() + 'Z'
+            cutoff_str = _iso_z(self._cycle_now - self._worker_lookback)
+            
+            # Only status and started_at are read downstream
+            recent_runs_query = self.supabase.table('worker_runs').select(
+                'status, started_at'
+            ).gte('started_at', cutoff_str).order('started_at', desc=True)
+            
+            # Recent workers are only counted, so ask PostgREST for the count without rows
+            recent_workers_query = self.supabase.table('workers').select(
+                'id', count='exact', head=True
+            ).gte('registered_at', cutoff_str)
             
-            recent_runs = self.supabase.table('worker_runs').select(
-                'id, worker_id, status, started_at, completed_at, tasks_processed, tasks_failed'
-            ).gte('started_at', cutoff_str).order('started_at', desc=True).execute()
+            # Runs, workers and schedule windows are independent, so fetch them concurrently
+            recent_runs, recent_workers, schedule_issues = await asyncio.gather(
+                self._execute(recent_runs_query),
+                self._execute(recent_workers_query),
+                self.check_worker_schedule()
+            )
             
-            # Get recent workers
-            recent_workers = self.supabase.table('workers').select(
-                'id, worker_id, status, registered_at, metadata'
-            ).gte('registered_at', cutoff_str).order('registered_at', desc=True).execute()
+            # One pass collects the run count, completions and newest start time
+            run_count = 0
+            successful_runs = 0
+            first_started = None
+            for run in recent_runs.data or ():
+                run_count += 1
+                successful_runs += run['status'] == 'completed'
+                first_started = first_started or run['started_at']
             
             # Analyze health
             health_status = {
                 'service': 'worker',
                 'status': 'healthy',
-                'recent_runs': len(recent_runs.data) if recent_runs.data else 0,
-                'recent_workers': len(recent_workers.data) if recent_workers.data else 0,
+                'recent_runs': run_count,
+                'recent_workers': recent_workers.count or 0,
                 'success_rate': 0,
                 'last_run': None,
                 'issues': []
             }
             
-            if recent_runs.data:
-                successful_runs = sum(1 for run in recent_runs.data if run['status'] == 'completed')
-                health_status['success_rate'] = (successful_runs / len(recent_runs.data)) * 100
-                health_status['last_run'] = recent_runs.data[0]['started_at']
+            if run_count:
+                health_status['success_rate'] = (successful_runs / run_count) * 100
+                health_status['last_run'] = first_started
                 
                 # Check for failures
                 if health_status['success_rate'] < 80:
@@ -134,7 +342,6 @@ class NewsletterMonitoringService:
                 health_status['issues'].append("No recent worker runs found")
             
             # Check schedule adherence
-            schedule_issues = self.check_worker_schedule()
             if schedule_issues:
                 health_status['issues'].extend(schedule_issues)
                 if health_status['status'] == 'healthy':
@@ -152,35 +359,49 @@ class NewsletterMonitoringService:
                 'issues': [f"Health check failed: {e}"]
             }
     
-    def check_publisher_health(self):
+    async def check_publisher_health(self):
         """Check publisher service health"""
         logger.info("📰 Checking Publisher Service health...")
         
         try:
             # Get recent newsletters (last 24 hours)
-            cutoff_time = datetime.utcnow() - timedelta(hours=24)
-            cutoff_str = cutoff_time.isoformat() + 'Z'
+            now = self._cycle_now
+            cutoff_time = now - self._publisher_lookback
             
-            recent_newsletters = self.supabase.table('newsletters').select(
-                'uuid, title, generated_at, vertical_id'
-            ).not_.like('title', 'CONFIG_%').not_.like('title', 'PROMPT_%').gte('generated_at', cutoff_str).order('generated_at', desc=True).execute()
+            # The schedule windows and the 24 hour lookback share one query over their union
+            schedule_windows = self._publisher_windows(now)
+            union_cutoff = min([cutoff_time] + [window_start for _, window_start, _ in schedule_windows])
+            union_cutoff_str = _iso_z(union_cutoff)
+            
+            newsletters = await self._execute(
+                self.supabase.table('newsletters').select(
+                    'generated_at'
+                ).not_.like('title', 'CONFIG_%').not_.like('title', 'PROMPT_%').gte('generated_at', union_cutoff_str).order('generated_at', desc=True)
+            )
+            
+            # Partition in Python: the lookback feeds health, every row is checked against the windows
+            generated = [self._parse_timestamp(newsletter['generated_at']) for newsletter in newsletters.data or ()]
+            recent_newsletters = [
+                newsletter for newsletter, generated_at in zip(newsletters.data or (), generated)
+                if generated_at >= cutoff_time
+            ]
             
             # Analyze health
             health_status = {
                 'service': 'publisher',
                 'status': 'healthy',
-                'recent_newsletters': len(recent_newsletters.data) if recent_newsletters.data else 0,
+                'recent_newsletters': len(recent_newsletters),
                 'last_generation': None,
                 'issues': []
             }
             
-            if recent_newsletters.data:
-                health_status['last_generation'] = recent_newsletters.data[0]['generated_at']
+            if recent_newsletters:
+                health_status['last_generation'] = recent_newsletters[0]['generated_at']
                 
                 # Check if generation is recent enough
                 if health_status['last_generation']:
-                    last_gen_time = datetime.fromisoformat(health_status['last_generation'].replace('Z', '+00:00'))
-                    hours_since_last = (datetime.utcnow().replace(tzinfo=last_gen_time.tzinfo) - last_gen_time).total_seconds() / 3600
+                    last_gen_time = self._parse_timestamp(health_status['last_generation'])
+                    hours_since_last = (now - last_gen_time).total_seconds() / 3600
                     
                     if hours_since_last > 25:  # Should generate daily
                         health_status['status'] = 'degraded'
@@ -193,7 +414,7 @@ class NewsletterMonitoringService:
                 health_status['issues'].append("No recent newsletter generation")
             
             # Check schedule adherence
-            schedule_issues = self.check_publisher_schedule()
+            schedule_issues = self.check_publisher_schedule(schedule_windows, generated)
             if schedule_issues:
                 health_status['issues'].extend(schedule_issues)
                 if health_status['status'] == 'healthy':
@@ -211,64 +432,111 @@ class NewsletterMonitoringService:
                 'issues': [f"Health check failed: {e}"]
             }
     
-    def check_worker_schedule(self):
+    @staticmethod
+    def _slot_minutes(times):
+        """Convert 'HH:MM' schedule times to sorted minutes past midnight"""
+        return tuple(sorted(int(hour) * 60 + int(minute) for hour, minute in (t.split(':') for t in times)))
+    
+    @staticmethod
+    def _parse_timestamp(value):
+        """Parse a Supabase timestamp into an aware UTC datetime"""
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if parsed.tzinfo is None:
+            return parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc)
+    
+    @staticmethod
+    def _overdue_slots(slot_minutes, max_delay_minutes, now):
+        """Return today's slots whose tolerance window has already closed"""
+        now_minutes = now.hour * 60 + now.minute + (now.second + now.microsecond / 1e6) / 60
+        # Slots are sorted, so every slot before the cut point is past its deadline
+        return slot_minutes[:bisect.bisect_left(slot_minutes, now_minutes - max_delay_minutes)]
+    
+    async def check_worker_schedule(self):
         """Check if worker is running on schedule"""
         issues = []
         
         try:
-            now = datetime.utcnow()
-            today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            now = self._cycle_now
+            overdue_slots = self._overdue_slots(self._worker_slot_minutes, self._worker_max_delay, now)
             
-            # Check each scheduled time
-            for scheduled_time in self.worker_schedule['times']:
-                hour, minute = map(int, scheduled_time.split(':'))
-                scheduled_datetime = today_start.replace(hour=hour, minute=minute)
-                
-                # If scheduled time has passed, check if worker ran
-                if now > scheduled_datetime + timedelta(minutes=self.worker_schedule['max_delay_minutes']):
-                    # Look for worker runs around this time
-                    window_start = scheduled_datetime - timedelta(minutes=15)
-                    window_end = scheduled_datetime + timedelta(minutes=self.worker_schedule['max_delay_minutes'])
-                    
-                    runs_in_window = self.supabase.table('worker_runs').select('id').gte(
-                        'started_at', window_start.isoformat() + 'Z'
-                    ).lte('started_at', window_end.isoformat() + 'Z').execute()
-                    
-                    if not runs_in_window.data:
-                        issues.append(f"Missed scheduled run at {scheduled_time} UTC")
+            today = now.date()
+            confirmed_day, confirmed = self._confirmed_worker_slots
+            if confirmed_day != today:
+                confirmed = set()
+                self._confirmed_worker_slots = (today, confirmed)
+            
+            # Only closed windows not already confirmed today need a query; slots still in
+            # their grace window were never overdue, and a confirmed slot can't become missed
+            pending_slots = [slot for slot in overdue_slots if slot not in confirmed]
+            if not pending_slots:
+                return issues
+            
+            # Look for worker runs from 15 minutes before each slot until its deadline
+            windows = [_window_bounds(today, slot, 15, self._worker_max_delay) for slot in pending_slots]
+            
+            # One query OR-ing the windows together, so rows between windows never come back
+            window_filter = ','.join(
+                f'and(started_at.gte."{start_str}",started_at.lte."{end_str}")'
+                for _, _, start_str, end_str in windows
+            )
+            # Not cached: a missed slot stays pending so a late-arriving run can still clear it
+            runs = await self._execute(
+                self.supabase.table('worker_runs').select('started_at').or_(window_filter)
+            )
+            
+            if len(runs.data or ()) >= self.supabase_max_rows:
+                # A capped response may be missing a window's rows; ask each window on its own
+                logger.warning(f"⚠️ Schedule query hit the {self.supabase_max_rows} row cap, checking windows individually")
+                results = await asyncio.gather(*[
+                    self._execute(
+                        self.supabase.table('worker_runs').select('started_at').gte(
+                            'started_at', start_str
+                        ).lte('started_at', end_str).limit(1)
+                    )
+                    for _, _, start_str, end_str in windows
+                ])
+                ran = [bool(result.data) for result in results]
+            else:
+                started = sorted(self._parse_timestamp(run['started_at']) for run in runs.data or ())
+                ran = [
+                    bisect.bisect_right(started, window_end) > bisect.bisect_left(started, window_start)
+                    for window_start, window_end, _, _ in windows
+                ]
+            
+            for slot, slot_ran in zip(pending_slots, ran):
+                if slot_ran:
+                    confirmed.add(slot)
+                else:
+                    issues.append(f"Missed scheduled run at {slot // 60:02d}:{slot % 60:02d} UTC")
             
         except Exception as e:
             issues.append(f"Schedule check failed: {e}")
         
         return issues
     
-    def check_publisher_schedule(self):
-        """Check if publisher is running on schedule"""
+    def _publisher_windows(self, now):
+        """Return (slot, window_start, window_end) for today's closed publisher windows"""
+        overdue_slots = self._overdue_slots(self._publisher_slot_minutes, self._publisher_max_delay, now)
+        
+        # Look for newsletter generation from 30 minutes before the slot until its deadline
+        today = now.date()
+        return [
+            (slot, *_window_bounds(today, slot, 30, self._publisher_max_delay)[:2])
+            for slot in overdue_slots
+        ]
+    
+    def check_publisher_schedule(self, schedule_windows, generated):
+        """Check if publisher is running on schedule, given already-fetched generation times"""
         issues = []
         
         try:
-            now = datetime.utcnow()
-            today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            
-            # Check scheduled time (8:00 UTC)
-            scheduled_time = self.publisher_schedule['times'][0]
-            hour, minute = map(int, scheduled_time.split(':'))
-            scheduled_datetime = today_start.replace(hour=hour, minute=minute)
-            
-            # If scheduled time has passed, check if publisher ran
-            if now > scheduled_datetime + timedelta(minutes=self.publisher_schedule['max_delay_minutes']):
-                # Look for newsletter generation around this time
-                window_start = scheduled_datetime - timedelta(minutes=30)
-                window_end = scheduled_datetime + timedelta(minutes=self.publisher_schedule['max_delay_minutes'])
-                
-                newsletters_in_window = self.supabase.table('newsletters').select('uuid').not_.like(
-                    'title', 'CONFIG_%'
-                ).not_.like('title', 'PROMPT_%').gte(
-                    'generated_at', window_start.isoformat() + 'Z'
-                ).lte('generated_at', window_end.isoformat() + 'Z').execute()
-                
-                if not newsletters_in_window.data:
-                    issues.append(f"Missed scheduled generation at {scheduled_time} UTC")
+            generated = sorted(generated)
+            
+            # Check scheduled time (8:00 UTC) once its tolerance window has closed
+            for slot, window_start, window_end in schedule_windows:
+                if bisect.bisect_right(generated, window_end) == bisect.bisect_left(generated, window_start):
+                    issues.append(f"Missed scheduled generation at {slot // 60:02d}:{slot % 60:02d} UTC")
         
         except Exception as e:
             issues.append(f"Schedule check failed: {e}")
@@ -276,99 +544,119 @@ class NewsletterMonitoringService:
         return issues
     
     def record_monitoring_event(self, service_name, status, metadata=None):
-        """Record monitoring event in database"""
+        """Queue a monitoring event for the next bulk insert"""
+        self._pending_events.append({
+            'service_name': service_name,
+            'status': status,
+            'last_check': self._cycle_now_iso,
+            'metadata': metadata or {}
+        })
+    
+    async def _flush_events(self):
+        """Write queued monitoring events in a single insert"""
+        events, self._pending_events = self._pending_events, []
+        if not events:
+            return
+        
         try:
-            monitoring_data = {
-                'service_name': service_name,
-                'status': status,
-                'last_check': datetime.utcnow().isoformat() + 'Z',
-                'metadata': metadata or {}
-            }
-            
-            self.supabase.table('process_monitoring').insert(monitoring_data).execute()
-            logger.info(f"📊 Recorded monitoring event: {service_name} - {status}")
+            await self._execute(self.supabase.table('process_monitoring').insert(events))
+            logger.info(f"📊 Recorded {len(events)} monitoring events")
             
         except Exception as e:
-            logger.error(f"❌ Failed to record monitoring event: {e}")
+            # Fall back to row-by-row so one bad row doesn't lose the others
+            logger.warning(f"⚠️ Bulk monitoring insert failed, retrying per event: {e}")
+            for event in events:
+                try:
+                    await self._execute(self.supabase.table('process_monitoring').insert(event))
+                    logger.info(f"📊 Recorded monitoring event: {event['service_name']} - {event['status']}")
+                except Exception as e:
+                    logger.error(f"❌ Failed to record monitoring event: {e}")
+    
+    @staticmethod
+    def alert_fingerprint(service_name, subject, status=None):
+        """Key an alert on service and status so changing issue text doesn't defeat the cooldown"""
+        status_bucket = status or _NUMBER_RE.sub('N', subject)
+        return f"{service_name}|{status_bucket}"
     
-    def send_alert(self, subject, message, service_name):
+    def send_alert(self, subject, message, service_name, status=None):
         """Send email alert"""
         if not self.email_alerts_enabled:
             logger.info("📧 Email alerts disabled, skipping alert")
             return
         
         # Check cooldown
-        alert_key = f"{service_name}_{subject}"
-        now = datetime.utcnow()
+        alert_key = self.alert_fingerprint(service_name, subject, status)
+        sent_at = time.monotonic()
+        cooldown = self.alert_cooldown_minutes * 60
+        
+        entry = self.last_alert_times.get(alert_key)
+        if entry is not None and sent_at - entry[0] < cooldown:
+            entry[1] += 1
+            logger.info(f"📧 Alert cooldown active for {service_name}: {subject}, skipping")
+            return
         
-        if alert_key in self.last_alert_times:
-            time_since_last = (now - self.last_alert_times[alert_key]).total_seconds() / 60
-            if time_since_last < self.alert_cooldown_minutes:
-                logger.info(f"📧 Alert cooldown active for {alert_key}, skipping")
-                return
+        if entry is not None and entry[1]:
+            # Fold everything swallowed by the cooldown into one summary line
+            minutes_since_sent = (sent_at - entry[0]) / 60
+            message = f"{message}\n\n({entry[1]} duplicate alerts suppressed over the last {minutes_since_sent:.0f} minutes)"
         
         try:
-            msg = MIMEMultipart()
-            msg['From'] = self.alert_email_from
-            msg['To'] = self.alert_email_to
+            msg = EmailMessage()
+            for header, value in self._alert_headers.items():
+                msg[header] = value
             msg['Subject'] = f"{self.alert_subject_prefix} {subject}"
+            msg.set_content(self._body_template.substitute(
+                service=service_name, time=self._cycle_now_iso, subject=subject, message=message
+            ))
             
-            body = f"""
-Newsletter System Alert
-
-Service: {service_name}
-Time: {now.isoformat()} UTC
-Issue: {subject}
-
-Details:
-{message}
-
----
-Newsletter System Monitoring Service
-"""
-            
-            msg.attach(MIMEText(body, 'plain'))
-            
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            if self.smtp_use_tls:
-                server.starttls()
-            server.login(self.smtp_username, self.smtp_password)
-            server.send_message(msg)
-            server.quit()
+            self._smtp_breaker.call(
+                self._smtp_pool.send,
+                lambda server: server.send_message(msg, to_addrs=self.alert_recipients)
+            )
             
-            self.last_alert_times[alert_key] = now
+            # Forget lapsed fingerprints so the table stays small, but keep any still
+            # holding a suppressed count until their own next alert reports it
+            for key in [k for k, (last_sent, suppressed) in self.last_alert_times.items()
+                        if not suppressed and sent_at - last_sent >= cooldown]:
+                del self.last_alert_times[key]
+            self.last_alert_times[alert_key] = [sent_at, 0]
             logger.info(f"📧 Alert sent: {subject}")
             
         except Exception as e:
             logger.error(f"❌ Failed to send alert: {e}")
     
-    def run_monitoring_cycle(self):
+    async def run_monitoring_cycle(self):
         """Run one complete monitoring cycle"""
         logger.info("🔄 Starting monitoring cycle...")
+        self._begin_cycle()
         
         try:
-            # Check worker health
-            worker_health = self.check_worker_health()
+            # Worker and publisher checks share no state, so run them side by side
+            worker_health, publisher_health = await asyncio.gather(
+                self.check_worker_health(),
+                self.check_publisher_health()
+            )
+            
             self.record_monitoring_event('worker', worker_health['status'], worker_health)
+            self.record_monitoring_event('publisher', publisher_health['status'], publisher_health)
+            await self._flush_events()
             
             if worker_health['status'] in ['degraded', 'error', 'inactive']:
                 issues_text = '\n'.join(worker_health.get('issues', []))
                 self.send_alert(
                     f"Worker Service {worker_health['status'].title()}",
                     f"Worker service issues detected:\n\n{issues_text}",
-                    'worker'
+                    'worker',
+                    status=worker_health['status']
                 )
             
-            # Check publisher health
-            publisher_health = self.check_publisher_health()
-            self.record_monitoring_event('publisher', publisher_health['status'], publisher_health)
-            
             if publisher_health['status'] in ['degraded', 'error', 'inactive']:
                 issues_text = '\n'.join(publisher_health.get('issues', []))
                 self.send_alert(
                     f"Publisher Service {publisher_health['status'].title()}",
                     f"Publisher service issues detected:\n\n{issues_text}",
-                    'publisher'
+                    'publisher',
+                    status=publisher_health['status']
                 )
             
             # Log summary
@@ -379,6 +667,13 @@ Newsletter System Monitoring Service
             self.send_alert("Monitoring System Error", f"Monitoring cycle failed: {e}", "monitoring")
     
     def run(self):
+        """Start the monitoring event loop"""
+        try:
+            asyncio.run(self._run())
+        except KeyboardInterrupt:
+            logger.info("🛑 Monitoring service stopped by user")
+    
+    async def _run(self):
         """Main monitoring loop"""
         logger.info("🚀 Newsletter Monitoring Service started")
         logger.info(f"⚙️ Health check interval: {self.health_check_interval}s")
@@ -389,14 +684,27 @@ Newsletter System Monitoring Service
             return
         
         try:
+            # Cycles start on a fixed grid of monotonic ticks; an overrun drops the ticks it
+            # swallowed rather than firing the missed cycles back to back
+            next_deadline = time.monotonic() + self.health_check_interval
+            
             while True:
-                self.run_monitoring_cycle()
+                await self.run_monitoring_cycle()
+                self._smtp_pool.close_if_idle()
                 
-                logger.info(f"😴 Sleeping for {self.health_check_interval} seconds...")
-                time.sleep(self.health_check_interval)
+                skipped = 0
+                while next_deadline <= time.monotonic():
+                    next_deadline += self.health_check_interval
+                    skipped += 1
+                if skipped:
+                    logger.warning(f"⚠️ Monitoring cycle overran, skipped {skipped} tick(s)")
+                
+                sleep_for = max(0, next_deadline - time.monotonic())
+                next_deadline += self.health_check_interval
+                
+                logger.info(f"😴 Sleeping for {sleep_for:.0f} seconds...")
+                await asyncio.sleep(sleep_for)
                 
-        except KeyboardInterrupt:
-            logger.info("🛑 Monitoring service stopped by user")
         except Exception as e:
             logger.error(f"💥 Monitoring service crashed: {e}")
             raise
@@ -0,0 +1,94 @@
+"""
+Newsletter System SMTP Connection Pool
+Single reusable SMTP connection shared by the monitoring services' alert paths
+"""
+
+import time
+import atexit
+import logging
+import smtplib
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class SMTPConnectionPool:
+    """One logged-in SMTP connection, reused until it sits idle too long or drops"""
+    
+    def __init__(self, server, port, username, password, use_tls=True, max_idle=360, timeout=10):
+        self.server = server
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.max_idle = max_idle  # seconds; NOOP still catches sessions the server drops sooner
+        self.timeout = timeout
+        self._conn = None
+        self._last_used = 0
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+    
+    def _idle_too_long(self):
+        return time.monotonic() - self._last_used > self.max_idle
+    
+    def _get(self):
+        """Return a live connection, reconnecting if idle too long or dropped"""
+        if self._conn is not None:
+            stale = self._idle_too_long()
+            if not stale:
+                try:
+                    stale = self._conn.noop()[0] != 250
+                except (smtplib.SMTPException, OSError):
+                    stale = True
+            if stale:
+                self._close()
+        
+        if self._conn is None:
+            conn = smtplib.SMTP(self.server, self.port, timeout=self.timeout)
+            if self.use_tls:
+                conn.starttls()
+            conn.login(self.username, self.password)
+            self._conn = conn
+        
+        return self._conn
+    
+    def _close(self):
+        if self._conn is None:
+            return
+        
+        try:
+            self._conn.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._conn = None
+    
+    def send(self, deliver):
+        """Call deliver(connection) on the pooled connection, retrying once if the server hung up"""
+        with self._lock:
+            try:
+                deliver(self._get())
+            except smtplib.SMTPServerDisconnected:
+                self._close()
+                try:
+                    deliver(self._get())
+                except (smtplib.SMTPException, OSError):
+                    self._close()
+                    raise
+            except (smtplib.SMTPException, OSError):
+                # Never hand a half-broken session to the next alert
+                self._close()
+                raise
+            
+            self._last_used = time.monotonic()
+    
+    def close_if_idle(self):
+        """Close the connection once it has been idle past max_idle"""
+        with self._lock:
+            if self._conn is not None and self._idle_too_long():
+                logger.info("📧 Closing idle SMTP connection")
+                self._close()
+    
+    def close(self):
+        """Close the pooled connection"""
+        with self._lock:
+            self._close()